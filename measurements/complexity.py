@@ -1,16 +1,332 @@
 import os
 import re
 import json
-import fnmatch
 import ast
+import heapq
+import mmap
+import sys
 import xml.etree.ElementTree as ET
+from bisect import bisect_right
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
+
+try:
+    from blake3 import blake3 as _content_hash
+except ImportError:
+    from hashlib import blake2b as _content_hash
+
+_CONFIG_EXTENSIONS = ('.xml', '.properties', '.yml', '.yaml', '.json', '.conf', '.config', '.ini')
+_BUILD_FILES = ("pom.xml", "build.gradle", "build.gradle.kts")
+# Matches a method signature up to its opening brace; the body is found by _find_closing_brace
+_METHOD_HEADER_RE = re.compile(r'(?:public|private|protected)(?:\s+static)?\s+[\w<>\[\],\s]+\s+(\w+)\s*\([^)]*\)\s*(?:throws\s+[\w,\s]+)?\s*\{')
+# Tokens that matter for brace matching: string/char literals and comments are consumed whole
+_BRACE_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|//[^\n]*|/\*[\s\S]*?\*/|[{}]')
+# Import classification by top-level package; anything not listed is internal.
+# External detection is simplified - in reality it would need better heuristics.
+_STANDARD_PACKAGE, _EXTERNAL_PACKAGE, _INTERNAL_PACKAGE = 0, 1, 2
+_PACKAGE_KIND = {
+    'java': _STANDARD_PACKAGE, 'javax': _STANDARD_PACKAGE, 'jakarta': _STANDARD_PACKAGE,
+    'com': _EXTERNAL_PACKAGE, 'org': _EXTERNAL_PACKAGE, 'io': _EXTERNAL_PACKAGE, 'net': _EXTERNAL_PACKAGE
+}
+_POM_NS = "{http://maven.apache.org/POM/4.0.0}"
+_POM_DEPENDENCIES = _POM_NS + "dependencies"
+_POM_DEPENDENCY = _POM_NS + "dependency"
+_POM_PLUGINS = _POM_NS + "plugins"
+_POM_PLUGIN = _POM_NS + "plugin"
+_POM_PROFILES = _POM_NS + "profiles"
+_POM_PROFILE = _POM_NS + "profile"
+# Applied to the content with a newline prepended: a literal-led pattern lets the
+# regex engine jump straight to candidates instead of trying a MULTILINE ^ everywhere
+_IMPORT_RE = re.compile(r'\nimport\s+([\w.]+);')
+# Histogram buckets as (inclusive lower bound, label)
+_METHOD_LENGTH_BUCKETS = ((1, "1-10"), (11, "11-20"), (21, "21-30"), (31, "31-50"), (51, "50+"))
+_COMPLEXITY_BUCKETS = ((1, "1-5"), (6, "6-10"), (11, "11-15"), (16, "16-20"), (21, "20+"))
+# Per-file results and directory listings are cached here, under the analyzed
+# project; bump the version whenever the per-file analysis or cache layout changes
+_CACHE_DIR_NAME = ".complexity_cache"
+_CACHE_VERSION = 4
+# Java files at least this large are memory-mapped instead of read into a bytes copy
+_MMAP_MIN_SIZE = 1 << 20
+# Read size for counting config file lines
+_LINE_COUNT_CHUNK = 1 << 20
+# Below this many Java files, process start-up costs more than it saves
+_PROCESS_POOL_MIN_FILES = 32
+
+def _classify_files(root, filenames, buckets):
+    """Append each file under root to the matching (java, xml, config, build) bucket"""
+    java_files, xml_files, config_files, build_files = buckets
+    for filename in filenames:
+        file_path = os.path.join(root, filename)
+        file_ext = os.path.splitext(filename)[1].lower()
+        
+        if filename.endswith(".java"):
+            java_files.append(file_path)
+        elif filename.endswith(".xml"):
+            xml_files.append(file_path)
+        
+        if file_ext in _CONFIG_EXTENSIONS:
+            config_files.append(file_path)
+        if filename in _BUILD_FILES:
+            build_files.append(file_path)
+
+def _list_dir(path, rel_path, cached_dirs, seen_dirs):
+    """Return (file names, subdirectory names) directly inside path
+    
+    With cached_dirs (relative path -> [mtime_ns, files, subdirs]), a
+    directory whose mtime is unchanged reuses its cached listing: its
+    entries cannot have been added, removed or renamed, so one stat call
+    replaces the scandir. Every listing used is recorded in seen_dirs.
+    Symlinked directories are not treated as subdirectories.
+    """
+    try:
+        if cached_dirs is not None:
+            mtime_ns = os.stat(path).st_mtime_ns
+            cached = cached_dirs.get(rel_path)
+            if cached is not None and cached[0] == mtime_ns:
+                seen_dirs[rel_path] = cached
+                return cached[1], cached[2]
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return [], []
+    
+    filenames = [e.name for e in entries if not e.is_dir()]
+    subdirs = [e.name for e in entries if e.is_dir() and not e.is_symlink()]
+    if cached_dirs is not None:
+        seen_dirs[rel_path] = [mtime_ns, filenames, subdirs]
+    return filenames, subdirs
+
+def _scan_dir(path, rel_path, buckets, cached_dirs, seen_dirs):
+    """Classify the files below path, recursing with os.scandir
+    
+    Directory entries carry their file type, so unlike os.walk there is no
+    extra lstat per subdirectory.
+    """
+    filenames, subdirs = _list_dir(path, rel_path, cached_dirs, seen_dirs)
+    _classify_files(path, filenames, buckets)
+    for name in subdirs:
+        _scan_dir(os.path.join(path, name), os.path.join(rel_path, name), buckets, cached_dirs, seen_dirs)
+
+def _scan_subtree(top, rel_top, cached_dirs):
+    """Scan one directory subtree; returns its (java, xml, config, build) file lists and listings"""
+    buckets = ([], [], [], [])
+    seen_dirs = {}
+    _scan_dir(top, rel_top, buckets, cached_dirs, seen_dirs)
+    return buckets, seen_dirs
+
+def _histogram(values, buckets):
+    """Count values into (lower bound, label) buckets in a single pass"""
+    lower_bounds = [lower for lower, _ in buckets]
+    counts = [0] * len(buckets)
+    for value in values:
+        index = bisect_right(lower_bounds, value) - 1
+        if index >= 0:
+            counts[index] += 1
+    return {label: count for (_, label), count in zip(buckets, counts)}
+
+def _find_closing_brace(content, open_pos):
+    """Return the index of the '}' matching the '{' at open_pos, or len(content)"""
+    depth = 0
+    for token in _BRACE_TOKEN_RE.finditer(content, open_pos):
+        brace = token.group()
+        if brace == '{':
+            depth += 1
+        elif brace == '}':
+            depth -= 1
+            if depth == 0:
+                return token.start()
+    return len(content)
+
+def _analyze_java_file(java_file, known_hash=None):
+    """Read one Java file and analyze it unless its content hash is already known.
+    
+    Returns (content_hash, result), where result is None if the hash
+    equals known_hash. Runs in worker processes, so it must stay a
+    module-level function.
+    """
+    with open(java_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            # Hash and decode straight from the mapping, skipping the bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _analyze_java_data(data, known_hash)
+        return _analyze_java_data(f.read(), known_hash)
+
+def _analyze_java_data(data, known_hash):
+    """Hash the raw bytes of a Java file (bytes or mmap) and analyze them if needed"""
+    content_hash = _content_hash(data).hexdigest()
+    if content_hash == known_hash:
+        return content_hash, None
+    
+    content = str(data, 'utf-8', 'ignore')
+    if '\r' in content:
+        # Same newline translation as a text-mode read
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content_hash, _process_java_content(content)
+
+def _process_java_content(content):
+    """Compute method, import and LOC data from the full text of a Java file.
+    
+    Returns (methods, imports, loc) where methods is a list of
+    (name, length, complexity) tuples. All three come from the same
+    in-memory content, so the file is never read more than once.
+    """
+    methods = _find_methods(content)
+    
+    # Find all imports; skip the regex scan when the keyword never appears
+    imports = _IMPORT_RE.findall("\n" + content) if 'import' in content else []
+    
+    return methods, imports, _count_lines(content)
+
+def _find_methods(content):
+    """Return (name, length, complexity) for each method declared in content"""
+    methods = []
+    # Without both '(' and '{' no method signature can match; skip the regex scan
+    if '(' not in content or '{' not in content:
+        return methods
+    
+    pos = 0
+    while True:
+        header = _METHOD_HEADER_RE.search(content, pos)
+        if header is None:
+            break
+        body_end = _find_closing_brace(content, header.end() - 1)
+        if body_end == len(content):
+            # Braces never balance: end the body where the next method starts
+            next_header = _METHOD_HEADER_RE.search(content, header.end())
+            if next_header is not None:
+                body_end = next_header.start()
+        method_name = header.group(1)
+        method_body = content[header.end():body_end]
+        # Resume inside the body so methods of anonymous and local classes are found too
+        pos = header.end()
+        
+        # Calculate method length (LOC)
+        method_lines = len(method_body.strip().split("\n"))
+        
+        # Calculate cyclomatic complexity
+        complexity = 1  # Base complexity
+        
+        # Count decision points
+        complexity += method_body.count("if ")
+        complexity += method_body.count("else ")
+        complexity += method_body.count("case ")
+        complexity += method_body.count("default:")
+        complexity += method_body.count("for ")
+        complexity += method_body.count("while ")
+        complexity += method_body.count("do ")
+        complexity += method_body.count("catch ")
+        complexity += method_body.count(" && ")
+        complexity += method_body.count(" || ")
+        complexity += method_body.count(" ? ")
+        
+        methods.append((method_name, method_lines, complexity))
+    
+    return methods
+
+def _count_lines(content):
+    """Classify the lines of a Java file as code, comment or blank"""
+    total = comments = blank = 0
+    in_comment = False
+    # Split on newlines only, as iterating a text-mode file did; splitlines()
+    # would also break on form feeds and other separators
+    lines = content.split("\n")
+    if content.endswith("\n") or not content:
+        lines.pop()
+    for line in lines:
+        line = line.strip()
+        total += 1
+        
+        if in_comment:
+            # Inside a multi-line comment
+            comments += 1
+            if "*/" in line:
+                in_comment = False
+        elif line.startswith("/*"):
+            # Start of a multi-line comment
+            comments += 1
+            if not line.endswith("*/"):
+                in_comment = True
+        elif line.startswith("//"):
+            # Single-line comment
+            comments += 1
+        elif not line:
+            # Blank line
+            blank += 1
+    
+    return {"total": total, "code": total - comments - blank, "comments": comments, "blank": blank}
+
+def _count_file_lines(path):
+    """Count the lines of a file in large binary chunks, without decoding or splitting
+    
+    Line ends follow universal newlines, as a text-mode read did: LF, CRLF
+    and a lone CR each end a line.
+    """
+    line_count = 0
+    last_chunk = b""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_LINE_COUNT_CHUNK), b""):
+            line_count += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+            if last_chunk.endswith(b"\r") and chunk.startswith(b"\n"):
+                # A CRLF split across two chunks is one line end, not two
+                line_count -= 1
+            last_chunk = chunk
+    if last_chunk and not last_chunk.endswith((b"\n", b"\r")):
+        # A final line without a newline still counts
+        line_count += 1
+    return line_count
+
+def _parse_pom(pom_file):
+    """Stream a Maven POM once, collecting its dependencies and plugin/profile counts"""
+    dependencies = []
+    plugins = 0
+    profiles = 0
+    parents = []
+    for event, elem in ET.iterparse(pom_file, events=("start", "end")):
+        if event == "start":
+            parents.append(elem.tag)
+            continue
+        
+        parents.pop()
+        parent = parents[-1] if parents else None
+        if elem.tag == _POM_DEPENDENCY and parent == _POM_DEPENDENCIES:
+            group_id = elem.find(_POM_NS + "groupId")
+            artifact_id = elem.find(_POM_NS + "artifactId")
+            version = elem.find(_POM_NS + "version")
+            if group_id is not None and artifact_id is not None:
+                version_text = version.text if version is not None else "unspecified"
+                dependencies.append((group_id.text, artifact_id.text, version_text))
+            elem.clear()
+        elif elem.tag == _POM_PLUGIN and parent == _POM_PLUGINS:
+            plugins += 1
+            elem.clear()
+        elif elem.tag == _POM_PROFILE and parent == _POM_PROFILES:
+            profiles += 1
+            elem.clear()
+    
+    return {"dependencies": dependencies, "plugins": plugins, "profiles": profiles}
+
+class FileAnalysis:
+    """Analysis results for one Java file, memoized on the analyzer"""
+    __slots__ = ("methods", "imports", "loc")
+    
+    def __init__(self, methods, imports, loc):
+        self.methods = methods
+        self.imports = imports
+        self.loc = loc
 
 class ComplexityAnalyzer:
-    def __init__(self, project_path):
+    def __init__(self, project_path, use_cache=True):
         self.project_path = project_path
+        self.use_cache = use_cache
         self.java_files = []
         self.xml_files = []
+        self.config_files = []
+        self.build_files = []
+        self._scanned = False
+        self._file_cache = {}
+        self._cache_entries = None
+        self._pom_data = {}
         self.complexity_metrics = {
             "avg_method_length": 0,
             "avg_cyclomatic_complexity": 0,
@@ -21,27 +337,139 @@ class ComplexityAnalyzer:
         }
         self.results = {}
         
+    def _scan_tree(self):
+        """Walk the project once, bucketing Java, XML, config and build files"""
+        if self._scanned:
+            return
+        self._scanned = True
+        
+        cached_dirs = self._load_cache("dirs.json") if self.use_cache else None
+        seen_dirs = {}
+        filenames, subdirs = _list_dir(self.project_path, "", cached_dirs, seen_dirs)
+        
+        buckets = (self.java_files, self.xml_files, self.config_files, self.build_files)
+        _classify_files(self.project_path, filenames, buckets)
+        
+        # Scan each top-level subtree on its own thread; directory reads release the GIL
+        subdirs = [name for name in subdirs if name != _CACHE_DIR_NAME]
+        if subdirs:
+            with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+                partials = executor.map(
+                    _scan_subtree,
+                    [os.path.join(self.project_path, name) for name in subdirs],
+                    subdirs,
+                    [cached_dirs] * len(subdirs)
+                )
+                for partial, partial_dirs in partials:
+                    for bucket, files in zip(buckets, partial):
+                        bucket.extend(files)
+                    seen_dirs.update(partial_dirs)
+        
+        # Listings of directories that are gone are dropped by saving only what was seen
+        if self.use_cache and seen_dirs != cached_dirs:
+            self._save_cache("dirs.json", seen_dirs)
+    
     def find_files(self):
         """Find all Java and XML configuration files in the project"""
-        for root, dirnames, filenames in os.walk(self.project_path):
-            for filename in fnmatch.filter(filenames, "*.java"):
-                self.java_files.append(os.path.join(root, filename))
-            for filename in fnmatch.filter(filenames, "*.xml"):
-                self.xml_files.append(os.path.join(root, filename))
-        
-        # Also find build files
-        build_files = []
-        for root, _, filenames in os.walk(self.project_path):
-            for filename in filenames:
-                if filename in ["pom.xml", "build.gradle", "build.gradle.kts"]:
-                    build_files.append(os.path.join(root, filename))
+        self._scan_tree()
         
         return {
             "java_files_count": len(self.java_files),
             "xml_files_count": len(self.xml_files),
-            "build_files": build_files
+            "build_files": list(self.build_files)
         }
     
+    def _pom_info(self, pom_file):
+        """Return the parsed POM (see _parse_pom), or None if it cannot be parsed"""
+        if pom_file not in self._pom_data:
+            try:
+                self._pom_data[pom_file] = _parse_pom(pom_file)
+            except Exception as e:
+                print(f"Error parsing {pom_file}: {str(e)}")
+                self._pom_data[pom_file] = None
+        return self._pom_data[pom_file]
+    
+    def _cache_path(self, name):
+        return os.path.join(self.project_path, _CACHE_DIR_NAME, name)
+    
+    def _load_cache(self, name):
+        """Load the entries of one cache file, or {} if there are none"""
+        if not self.use_cache:
+            return {}
+        try:
+            with open(self._cache_path(name), 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != _CACHE_VERSION:
+            return {}
+        return cache.get("entries", {})
+    
+    def _save_cache(self, name, entries):
+        cache_path = self._cache_path(name)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w') as f:
+                json.dump({"version": _CACHE_VERSION, "entries": entries}, f)
+        except OSError as e:
+            print(f"Error writing cache {cache_path}: {str(e)}")
+    
+    def _collect_java_data(self):
+        """Return [(path, FileAnalysis)] for all Java files, analyzing only files not seen yet"""
+        missing = [java_file for java_file in self.java_files if java_file not in self._file_cache]
+        if missing:
+            self._analyze_java_files(missing)
+        return [(java_file, self._file_cache[java_file]) for java_file in self.java_files]
+    
+    def _analyze_java_files(self, java_files):
+        """Analyze java_files into self._file_cache, reusing the on-disk cache where possible
+        
+        Files whose size and mtime match the cache are not read at all;
+        files that changed on disk are re-hashed and only re-analyzed when
+        their content differs.
+        """
+        if self._cache_entries is None:
+            self._cache_entries = self._load_cache("java_files.json")
+        entries = self._cache_entries
+        
+        pending = []
+        for java_file in java_files:
+            rel_path = os.path.relpath(java_file, self.project_path)
+            stat = os.stat(java_file)
+            entry = entries.get(rel_path)
+            if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                self._file_cache[java_file] = FileAnalysis(*entry["result"])
+            else:
+                pending.append((java_file, rel_path, stat, entry))
+        
+        paths = [java_file for java_file, _, _, _ in pending]
+        known_hashes = [entry["hash"] if entry else None for _, _, _, entry in pending]
+        if len(pending) >= _PROCESS_POOL_MIN_FILES:
+            with ProcessPoolExecutor() as executor:
+                analyzed = list(executor.map(_analyze_java_file, paths, known_hashes, chunksize=32))
+        else:
+            analyzed = list(map(_analyze_java_file, paths, known_hashes))
+        
+        for (java_file, rel_path, stat, entry), (content_hash, result) in zip(pending, analyzed):
+            if result is None:
+                result = entry["result"]
+            entries[rel_path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": content_hash,
+                "result": result
+            }
+            self._file_cache[java_file] = FileAnalysis(*result)
+        
+        if self.use_cache:
+            # Drop entries for files that no longer exist
+            current = {os.path.relpath(java_file, self.project_path) for java_file in self.java_files}
+            stale = [rel_path for rel_path in entries if rel_path not in current]
+            for rel_path in stale:
+                del entries[rel_path]
+            if pending or stale:
+                self._save_cache("java_files.json", entries)
+    
     def analyze_method_complexity(self):
         """Analyze method length and cyclomatic complexity"""
         method_lengths = []
@@ -49,22 +477,10 @@ class ComplexityAnalyzer:
         long_methods = []
         complex_methods = []
         
-        for java_file in self.java_files:
-            with open(java_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Find all method definitions
-            method_pattern = re.compile(r'(public|private|protected)(?:\s+static)?\s+[\w<>\[\],\s]+\s+(\w+)\s*\([^)]*\)\s*(?:throws\s+[\w,\s]+)?\s*\{([\s\S]*?)(?=\n\s*\})')
-            methods = method_pattern.findall(content)
-            
+        for java_file, analysis in self._collect_java_data():
             file_rel_path = os.path.relpath(java_file, self.project_path)
             
-            for method in methods:
-                method_name = method[1]
-                method_body = method[2]
-                
-                # Calculate method length (LOC)
-                method_lines = len(method_body.strip().split("\n"))
+            for method_name, method_lines, complexity in analysis.methods:
                 method_lengths.append(method_lines)
                 
                 if method_lines > 30:  # Threshold for long methods
@@ -74,22 +490,6 @@ class ComplexityAnalyzer:
                         "length": method_lines
                     })
                 
-                # Calculate cyclomatic complexity
-                complexity = 1  # Base complexity
-                
-                # Count decision points
-                complexity += method_body.count("if ")
-                complexity += method_body.count("else ")
-                complexity += method_body.count("case ")
-                complexity += method_body.count("default:")
-                complexity += method_body.count("for ")
-                complexity += method_body.count("while ")
-                complexity += method_body.count("do ")
-                complexity += method_body.count("catch ")
-                complexity += method_body.count(" && ")
-                complexity += method_body.count(" || ")
-                complexity += method_body.count(" ? ")
-                
                 cyclomatic_complexities.append(complexity)
                 
                 if complexity > 10:  # Threshold for complex methods
@@ -111,89 +511,51 @@ class ComplexityAnalyzer:
             "avg_cyclomatic_complexity": self.complexity_metrics["avg_cyclomatic_complexity"],
             "long_methods": long_methods[:10],  # Limit to top 10
             "complex_methods": complex_methods[:10],  # Limit to top 10
-            "method_length_distribution": {
-                "1-10": sum(1 for x in method_lengths if 1 <= x <= 10),
-                "11-20": sum(1 for x in method_lengths if 11 <= x <= 20),
-                "21-30": sum(1 for x in method_lengths if 21 <= x <= 30),
-                "31-50": sum(1 for x in method_lengths if 31 <= x <= 50),
-                "50+": sum(1 for x in method_lengths if x > 50)
-            },
-            "complexity_distribution": {
-                "1-5": sum(1 for x in cyclomatic_complexities if 1 <= x <= 5),
-                "6-10": sum(1 for x in cyclomatic_complexities if 6 <= x <= 10),
-                "11-15": sum(1 for x in cyclomatic_complexities if 11 <= x <= 15),
-                "16-20": sum(1 for x in cyclomatic_complexities if 16 <= x <= 20),
-                "20+": sum(1 for x in cyclomatic_complexities if x > 20)
-            }
+            "method_length_distribution": _histogram(method_lengths, _METHOD_LENGTH_BUCKETS),
+            "complexity_distribution": _histogram(cyclomatic_complexities, _COMPLEXITY_BUCKETS)
         }
     
     def analyze_dependencies(self):
         """Analyze dependency count and types"""
         import_counts = Counter()
-        external_dependencies = defaultdict(int)
-        internal_dependencies = defaultdict(int)
-        dependency_list = []
+        external_dependencies = Counter()
+        internal_dependencies = Counter()
         
         # Extract Maven/Gradle dependencies
         build_dependencies = []
         pom_files = [f for f in self.xml_files if f.endswith("pom.xml")]
         for pom_file in pom_files:
-            try:
-                tree = ET.parse(pom_file)
-                root = tree.getroot()
-                
-                # Handle namespaces in Maven POM files
-                namespace = {'maven': 'http://maven.apache.org/POM/4.0.0'}
+            pom = self._pom_info(pom_file)
+            if pom is None:
+                continue
+            
+            for group_id_text, artifact_id_text, version_text in pom["dependencies"]:
+                build_dependencies.append({
+                    "group": group_id_text,
+                    "artifact": artifact_id_text,
+                    "version": version_text
+                })
                 
-                # Find all dependencies
-                for dependency in root.findall(".//maven:dependencies/maven:dependency", namespace):
-                    group_id = dependency.find("maven:groupId", namespace)
-                    artifact_id = dependency.find("maven:artifactId", namespace)
-                    version = dependency.find("maven:version", namespace)
-                    
-                    if group_id is not None and artifact_id is not None:
-                        group_id_text = group_id.text
-                        artifact_id_text = artifact_id.text
-                        version_text = version.text if version is not None else "unspecified"
-                        
-                        dep_key = f"{group_id_text}:{artifact_id_text}"
-                        build_dependencies.append({
-                            "group": group_id_text,
-                            "artifact": artifact_id_text,
-                            "version": version_text
-                        })
-                        
-                        # Count external dependencies by group
-                        if not (group_id_text.startswith("com.internal") or group_id_text.startswith("org.internal")):
-                            external_dependencies[group_id_text] += 1
-            except Exception as e:
-                print(f"Error parsing {pom_file}: {str(e)}")
+                # Count external dependencies by group
+                if group_id_text and not (group_id_text.startswith("com.internal") or group_id_text.startswith("org.internal")):
+                    external_dependencies[group_id_text] += 1
         
         # Analyze imports in Java files
-        for java_file in self.java_files:
-            with open(java_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Find all imports
-            import_pattern = re.compile(r'^import\s+([\w.]+);', re.MULTILINE)
-            imports = import_pattern.findall(content)
+        for _, analysis in self._collect_java_data():
+            import_counts.update(analysis.imports)
             
-            for imp in imports:
-                import_counts[imp] += 1
-                
-                # Classify as internal or external
-                top_level_package = imp.split('.')[0]
-                if top_level_package in ['java', 'javax', 'jakarta']:
-                    # Standard Java imports
-                    continue
-                elif top_level_package in ['com', 'org', 'io', 'net']:
-                    # External dependencies (simplified - in reality would need better heuristics)
-                    external_dependencies[imp.split('.')[0] + '.' + imp.split('.')[1]] += 1
-                else:
-                    # Assume internal project dependencies
-                    internal_dependencies[top_level_package] += 1
-                
-                dependency_list.append(imp)
+            # Classify as internal or external; standard Java imports are neither
+            external = []
+            internal = []
+            for imp in analysis.imports:
+                parts = imp.split('.', 2)
+                kind = _PACKAGE_KIND.get(parts[0], _INTERNAL_PACKAGE)
+                if kind == _EXTERNAL_PACKAGE:
+                    external.append(parts[0] + '.' + parts[1])
+                elif kind == _INTERNAL_PACKAGE:
+                    internal.append(parts[0])
+            external_dependencies.update(external)
+            internal_dependencies.update(internal)
         
         # Calculate unique dependencies to avoid counting duplicate imports
         unique_imports = len(import_counts)
@@ -203,7 +565,7 @@ class ComplexityAnalyzer:
             "total_imports": sum(import_counts.values()),
             "unique_imports": unique_imports,
             "build_dependencies": build_dependencies,
-            "top_external_dependencies": dict(sorted(external_dependencies.items(), key=lambda x: x[1], reverse=True)[:10]),
+            "top_external_dependencies": dict(external_dependencies.most_common(10)),
             "internal_dependencies": dict(internal_dependencies),
             "external_dependency_count": sum(external_dependencies.values()),
             "internal_dependency_count": sum(internal_dependencies.values()),
@@ -219,50 +581,14 @@ class ComplexityAnalyzer:
         blank_loc = 0
         file_loc = {}
         
-        for java_file in self.java_files:
-            file_lines = 0
-            file_code_lines = 0
-            file_comment_lines = 0
-            file_blank_lines = 0
-            in_comment = False
-            
-            with open(java_file, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    total_loc += 1
-                    file_lines += 1
-                    
-                    if in_comment:
-                        # Inside a multi-line comment
-                        comment_loc += 1
-                        file_comment_lines += 1
-                        if "*/" in line:
-                            in_comment = False
-                    elif line.startswith("/*") or line.startswith("/**"):
-                        # Start of a multi-line comment
-                        comment_loc += 1
-                        file_comment_lines += 1
-                        if not line.endswith("*/"):
-                            in_comment = True
-                    elif line.startswith("//"):
-                        # Single-line comment
-                        comment_loc += 1
-                        file_comment_lines += 1
-                    elif line == "":
-                        # Blank line
-                        blank_loc += 1
-                        file_blank_lines += 1
-                    else:
-                        # Code line
-                        code_loc += 1
-                        file_code_lines += 1
+        for java_file, analysis in self._collect_java_data():
+            loc = analysis.loc
+            total_loc += loc["total"]
+            code_loc += loc["code"]
+            comment_loc += loc["comments"]
+            blank_loc += loc["blank"]
             
-            file_loc[os.path.relpath(java_file, self.project_path)] = {
-                "total": file_lines,
-                "code": file_code_lines,
-                "comments": file_comment_lines,
-                "blank": file_blank_lines
-            }
+            file_loc[os.path.relpath(java_file, self.project_path)] = loc
         
         self.complexity_metrics["total_loc"] = total_loc
         
@@ -272,7 +598,7 @@ class ComplexityAnalyzer:
             "comment_loc": comment_loc,
             "blank_loc": blank_loc,
             "code_to_comment_ratio": round(code_loc / max(1, comment_loc), 2),
-            "largest_files": sorted(file_loc.items(), key=lambda x: x[1]["code"], reverse=True)[:10]
+            "largest_files": heapq.nlargest(10, file_loc.items(), key=lambda x: x[1]["code"])
         }
     
     def analyze_config_complexity(self):
@@ -283,58 +609,45 @@ class ComplexityAnalyzer:
         config_files_by_type = defaultdict(int)
         largest_config_files = []
         
-        # Look for configuration files
-        config_extensions = ['.xml', '.properties', '.yml', '.yaml', '.json', '.conf', '.config', '.ini']
+        # Configuration files are collected by the same tree walk as the sources
+        self._scan_tree()
         
-        for root, _, filenames in os.walk(self.project_path):
-            for filename in filenames:
-                file_path = os.path.join(root, filename)
-                file_ext = os.path.splitext(filename)[1].lower()
+        for file_path in self.config_files:
+            filename = os.path.basename(file_path)
+            file_ext = os.path.splitext(filename)[1].lower()
+            
+            config_file_count += 1
+            config_files_by_type[file_ext] += 1
+            
+            # Count lines in config file
+            try:
+                line_count = _count_file_lines(file_path)
+                total_config_lines += line_count
                 
-                if file_ext in config_extensions:
-                    config_file_count += 1
-                    config_files_by_type[file_ext] += 1
-                    
-                    # Count lines in config file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = f.readlines()
-                            line_count = len(lines)
-                            total_config_lines += line_count
-                            
-                            largest_config_files.append({
-                                "file": os.path.relpath(file_path, self.project_path),
-                                "lines": line_count
-                            })
-                            
-                            # Add complexity based on config file size
-                            if line_count > 500:
-                                config_complexity_score += 5
-                            elif line_count > 200:
-                                config_complexity_score += 3
-                            elif line_count > 100:
-                                config_complexity_score += 2
-                            else:
-                                config_complexity_score += 1
-                    except Exception as e:
-                        print(f"Error reading {file_path}: {str(e)}")
+                largest_config_files.append({
+                    "file": os.path.relpath(file_path, self.project_path),
+                    "lines": line_count
+                })
                 
-                # Special handling for specific config files
-                if filename == "pom.xml":
-                    try:
-                        tree = ET.parse(file_path)
-                        root_elem = tree.getroot()  # Changed variable name from 'root' to 'root_elem'
-                        
-                        # Count plugins as a complexity factor
-                        namespace = {'maven': 'http://maven.apache.org/POM/4.0.0'}
-                        plugins = root_elem.findall(".//maven:plugins/maven:plugin", namespace)
-                        config_complexity_score += len(plugins)
-                        
-                        # Count profiles as a complexity factor
-                        profiles = root_elem.findall(".//maven:profiles/maven:profile", namespace)
-                        config_complexity_score += len(profiles) * 2
-                    except Exception as e:
-                        print(f"Error parsing {file_path}: {str(e)}")
+                # Add complexity based on config file size
+                if line_count > 500:
+                    config_complexity_score += 5
+                elif line_count > 200:
+                    config_complexity_score += 3
+                elif line_count > 100:
+                    config_complexity_score += 2
+                else:
+                    config_complexity_score += 1
+            except Exception as e:
+                print(f"Error reading {file_path}: {str(e)}")
+            
+            # Special handling for specific config files
+            if filename == "pom.xml":
+                pom = self._pom_info(file_path)
+                if pom is not None:
+                    # Count plugins and profiles as complexity factors
+                    config_complexity_score += pom["plugins"]
+                    config_complexity_score += pom["profiles"] * 2
         
         # Normalize configuration complexity score
         normalized_config_complexity = min(100, config_complexity_score)
@@ -345,7 +658,7 @@ class ComplexityAnalyzer:
             "config_files_by_type": dict(config_files_by_type),
             "total_config_lines": total_config_lines,
             "config_complexity_score": normalized_config_complexity,
-            "largest_config_files": sorted(largest_config_files, key=lambda x: x["lines"], reverse=True)[:10]
+            "largest_config_files": heapq.nlargest(10, largest_config_files, key=itemgetter("lines"))
         }
     
     def calculate_overall_complexity(self):
@@ -386,6 +699,9 @@ class ComplexityAnalyzer:
         file_stats = self.find_files()
         print(f"Found {file_stats['java_files_count']} Java files and {file_stats['xml_files_count']} XML files")
         
+        print("Analyzing Java sources...")
+        self._collect_java_data()
+        
         print("Analyzing method complexity...")
         method_results = self.analyze_method_complexity()
         
@@ -516,19 +832,21 @@ def main():
     parser.add_argument('--json', action='store_true', help='Output results as JSON')
     parser.add_argument('--output', help='Output file path for the report')
     parser.add_argument('--history', help='Path to historical complexity data for trend analysis')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the per-file analysis cache')
     
     args = parser.parse_args()
     
-    analyzer = ComplexityAnalyzer(args.project_path)
+    analyzer = ComplexityAnalyzer(args.project_path, use_cache=not args.no_cache)
     analyzer.analyze()
     
     if args.json:
-        result = json.dumps(analyzer.results, indent=2)
+        # Stream the JSON rather than building the whole document in memory
         if args.output:
             with open(args.output, 'w') as f:
-                f.write(result)
+                json.dump(analyzer.results, f, indent=2)
         else:
-            print(result)
+            json.dump(analyzer.results, sys.stdout, indent=2)
+            print()
     else:
         report = analyzer.generate_report()
         if args.output:
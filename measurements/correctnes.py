@@ -1,35 +1,166 @@
 import os
-import re
 import json
-import fnmatch
+import mmap
 import subprocess
+import xml.sax
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# Every token the test-file checks look for, searched in the raw bytes
+_TEST_MARKERS = (
+    b'org.jboss.arquillian', b'@RunWith(Arquillian.class)', b'org.junit', b'org.mockito',
+    b'Repository', b'EntityManager', b'DataSource', b'jdbc', b'sql'
+)
+_ARQUILLIAN_MARKERS = frozenset((b'org.jboss.arquillian', b'@RunWith(Arquillian.class)'))
+_ARQUILLIAN_DATA_STORE_MARKERS = frozenset((b'Repository', b'EntityManager', b'jdbc', b'sql'))
+_DATA_STORE_MARKERS = _ARQUILLIAN_DATA_STORE_MARKERS | {b'DataSource'}
+
+# Framework bits recorded per test file for check_test_framework
+_USES_JUNIT = 1
+_USES_MOCKITO = 2
+_USES_ARQUILLIAN = 4
+
+# Test sources at least this large are mapped instead of read into memory
+_MMAP_MIN_SIZE = 1 << 20
+
+# Below this many test files a thread pool costs more than it overlaps
+_THREAD_POOL_MIN_FILES = 8
+
+def _test_file_markers(test_file):
+    """Return the set of marker tokens present in a test source file"""
+    with open(test_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            content = f.read()
+            return {marker for marker in _TEST_MARKERS if marker in content}
+        # mmap's `in` only tests single bytes, so search with find()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return {marker for marker in _TEST_MARKERS if content.find(marker) != -1}
+
+# Execution data files the JaCoCo Maven plugin writes by default; merged into one report
+_JACOCO_EXEC_FILES = (
+    "target/coverage-reports/jacoco-ut.exec",
+    "target/coverage-reports/jacoco-it.exec",
+    "target/jacoco.exec",
+    "target/jacoco-it.exec"
+)
+
+# VCS and tooling directories never hold the project's own sources
+_SKIP_DIRS = frozenset(('.git', 'node_modules', '.gradle'))
+
+# Build output directories, pruned only beside the build file that owns them so
+# that source packages named build or target are still scanned
+_BUILD_OUTPUT_DIRS = frozenset(('target', 'build'))
+_BUILD_FILES = frozenset(('pom.xml', 'build.gradle', 'build.gradle.kts'))
+
+def _iter_java_files(path):
+    """Yield (path, name) for each .java file below path, skipping tooling and build output
+    
+    Directory entries carry their file type, so unlike os.walk there is no
+    extra lstat per subdirectory.
+    """
+    subdirs = []
+    has_build_file = False
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name not in _SKIP_DIRS and not entry.is_symlink():
+                        subdirs.append(entry)
+                elif entry.name.endswith('.java'):
+                    yield entry.path, entry.name
+                elif entry.name in _BUILD_FILES:
+                    has_build_file = True
+    except OSError:
+        return
+    for subdir in subdirs:
+        if has_build_file and subdir.name in _BUILD_OUTPUT_DIRS:
+            continue
+        yield from _iter_java_files(subdir.path)
+
+def _test_category(file_name):
+    """Classify a test file as unit, integration or data_store from its name"""
+    if 'IT.java' in file_name or 'Integration' in file_name:
+        return "integration"
+    if any(x in file_name for x in ['Repository', 'DAO', 'Data']):
+        return "data_store"
+    return "unit"
+
+def _scan_test_file(test_file):
+    """Return (markers, None) for a test file, or (None, error) if it can't be read"""
+    try:
+        return _test_file_markers(test_file), None
+    except Exception as e:
+        return None, e
+
+def _scan_test_files(test_files):
+    """Scan test files, returning their (markers, error) pairs in the same order
+    
+    Larger sets are read on a thread pool so that file I/O latency overlaps.
+    """
+    if len(test_files) < _THREAD_POOL_MIN_FILES:
+        return [_scan_test_file(test_file) for test_file in test_files]
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        return list(executor.map(_scan_test_file, test_files))
+
+def _framework_flags(markers):
+    """Fold a test file's marker tokens into a _USES_* bitmask"""
+    flags = 0
+    if b'org.junit' in markers:
+        flags |= _USES_JUNIT
+    if b'org.mockito' in markers:
+        flags |= _USES_MOCKITO
+    if b'org.jboss.arquillian' in markers:
+        flags |= _USES_ARQUILLIAN
+    return flags
+
+def _initial_metrics():
+    """Return the metrics a fresh analysis starts from"""
+    return {
+        "code_coverage": 0,
+        "critical_path_coverage": 0,
+        "total_tests": 0,
+        "passing_tests": 0,
+        "failing_tests": 0,
+        "data_store_test_coverage": 0,
+        "overall_score": 0
+    }
+
+class _SuiteHeaderRead(Exception):
+    """Raised to stop a SAX parse once the root attributes are read"""
+
+class _SuiteCountsHandler(xml.sax.ContentHandler):
+    """Grab the test counts from a report's root element and stop"""
+    def __init__(self):
+        super().__init__()
+        self.counts = {}
+    
+    def startElement(self, name, attrs):
+        self.counts = {key: attrs.get(key, 0) for key in ("tests", "failures", "errors", "skipped")}
+        raise _SuiteHeaderRead()
 
 class CorrectnessAnalyzer:
     def __init__(self, project_path):
         self.project_path = project_path
         self.java_files = []
-        self.test_files = []
-        self.metrics = {
-            "code_coverage": 0,
-            "critical_path_coverage": 0,
-            "total_tests": 0,
-            "passing_tests": 0,
-            "failing_tests": 0,
-            "data_store_test_coverage": 0,
-            "overall_score": 0
-        }
+        self.test_files = []  # (path, name-based category) pairs
+        self._scanned = False
+        self._framework_flags_by_file = {}
+        self._analysis_cache = None
+        self.metrics = _initial_metrics()
         
     def find_files(self):
         """Find Java source and test files"""
-        for root, _, filenames in os.walk(self.project_path):
-            for filename in fnmatch.filter(filenames, "*.java"):
-                path = os.path.join(root, filename)
-                if 'test' in path.lower() and not 'main' in path.lower():
-                    self.test_files.append(path)
-                else:
-                    self.java_files.append(path)
+        if self._scanned:
+            return len(self.java_files), len(self.test_files)
+        self._scanned = True
+        
+        for path, filename in _iter_java_files(self.project_path):
+            low = path.lower()
+            if 'test' in low and 'main' not in low:
+                self.test_files.append((path, _test_category(filename)))
+            else:
+                self.java_files.append(path)
         
         return len(self.java_files), len(self.test_files)
     
@@ -44,21 +175,26 @@ class CorrectnessAnalyzer:
             os.path.join(self.project_path, "target/coverage-reports/jacoco-ut/jacoco.xml"),
             os.path.join(self.project_path, "target/coverage-reports/jacoco-it/jacoco.xml")
         ]
-        
-        # Also directly check for the exec file and try to generate a report if needed
-        jacoco_exec = os.path.join(self.project_path, "target/coverage-reports/jacoco-ut.exec")
-        if os.path.exists(jacoco_exec) and not any(os.path.exists(path) for path in jacoco_paths):
-            print(f"Found JaCoCo exec file at {jacoco_exec} but no XML report. Attempting to generate one...")
+        # Stat each candidate once, keeping the canonical target/site location first
+        jacoco_paths = [path for path in jacoco_paths if os.path.exists(path)]
+        
+        # Also directly check for exec files and try to generate a report if needed
+        exec_files = [os.path.join(self.project_path, name) for name in _JACOCO_EXEC_FILES]
+        exec_files = [path for path in exec_files if os.path.exists(path)]
+        if exec_files and not jacoco_paths:
+            print(f"Found JaCoCo exec file at {', '.join(exec_files)} but no XML report. Attempting to generate one...")
             try:
                 # Create directory for report if it doesn't exist
                 report_dir = os.path.join(self.project_path, "target/coverage-reports/jacoco-ut")
                 os.makedirs(report_dir, exist_ok=True)
                 
-                # Try to generate a report from the exec file
+                # Generate one report from all exec files in a single JVM; the
+                # short-lived CLI only needs the C1 compiler and the shared archive
                 xml_report = os.path.join(report_dir, "jacoco.xml")
                 cmd = [
-                    "java", "-jar", os.path.expanduser("~/.m2/repository/org/jacoco/org.jacoco.cli/0.8.8/org.jacoco.cli-0.8.8-nodeps.jar"),
-                    "report", jacoco_exec,
+                    "java", "-XX:TieredStopAtLevel=1", "-Xshare:auto",
+                    "-jar", os.path.expanduser("~/.m2/repository/org/jacoco/org.jacoco.cli/0.8.8/org.jacoco.cli-0.8.8-nodeps.jar"),
+                    "report", *exec_files,
                     "--classfiles", os.path.join(self.project_path, "target/classes"),
                     "--xml", xml_report
                 ]
@@ -71,98 +207,107 @@ class CorrectnessAnalyzer:
             except Exception as e:
                 print(f"Error generating JaCoCo report: {str(e)}")
         
-        # Check if there are any XML files in the jacoco-ut directory
+        # JaCoCo always writes jacoco.xml, which is already a candidate above; only
+        # look for a differently named XML report in the jacoco-ut directory without it
         jacoco_ut_dir = os.path.join(self.project_path, "target/coverage-reports/jacoco-ut")
-        if os.path.exists(jacoco_ut_dir):
-            for file in os.listdir(jacoco_ut_dir):
-                if file.endswith(".xml"):
-                    xml_path = os.path.join(jacoco_ut_dir, file)
-                    print(f"Found potential JaCoCo XML report: {xml_path}")
-                    jacoco_paths.append(xml_path)
+        if os.path.join(jacoco_ut_dir, "jacoco.xml") not in jacoco_paths:
+            try:
+                with os.scandir(jacoco_ut_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".xml"):
+                            print(f"Found potential JaCoCo XML report: {entry.path}")
+                            jacoco_paths.append(entry.path)
+                            break
+            except OSError:
+                pass
         
         for path in jacoco_paths:
-            if os.path.exists(path):
-                print(f"Analyzing coverage report: {path}")
-                try:
-                    tree = ET.parse(path)
-                    root = tree.getroot()
-                    
-                    # Get coverage data from the report - try different approaches
-                    # First try to get overall INSTRUCTION counter
-                    total_covered = 0
-                    total_missed = 0
-                    
-                    # Look for instruction counters at report level
-                    for counter in root.findall(".//counter[@type='INSTRUCTION']"):
-                        covered = int(counter.get("covered", 0))
-                        missed = int(counter.get("missed", 0))
-                        total_covered += covered
-                        total_missed += missed
-                    
-                    # Calculate overall coverage from all instructions
-                    total_instructions = total_covered + total_missed
-                    if total_instructions > 0:
-                        overall_coverage = (total_covered / total_instructions) * 100
-                        coverage_data["overall"] = round(overall_coverage, 2)
-                        print(f"Calculated actual coverage: {coverage_data['overall']}% ({total_covered} covered out of {total_instructions} instructions)")
-                    
-                    # If no overall coverage found, fall back to original method with LINE counters
-                    if coverage_data["overall"] == 0:
-                        # Try line coverage
-                        for counter in root.findall(".//counter[@type='LINE']"):
-                            covered = int(counter.get("covered", 0))
-                            missed = int(counter.get("missed", 0))
-                            total = covered + missed
-                            if total > 0:
-                                coverage_data["overall"] = round(covered / total * 100, 2)
-                                break
+            print(f"Analyzing coverage report: {path}")
+            try:
+                # Stream the report once. Report-level counters are direct
+                # children of <report> (depth 1 once they close); each
+                # <package> is summarized from its own counters and then
+                # cleared so memory stays flat on large reports.
+                total_covered = 0
+                total_missed = 0
+                line_covered = 0
+                line_missed = 0
+                depth = 0
+                for event, elem in ET.iterparse(path, events=("start", "end")):
+                    if event == "start":
+                        depth += 1
+                        continue
+                    depth -= 1
                     
-                    # Get coverage by package
-                    for package in root.findall(".//package"):
-                        pkg_name = package.get("name", "default")
+                    if elem.tag == "counter" and depth == 1:
+                        if elem.get("type") == "INSTRUCTION":
+                            total_covered += int(elem.get("covered", 0))
+                            total_missed += int(elem.get("missed", 0))
+                        elif elem.get("type") == "LINE":
+                            line_covered += int(elem.get("covered", 0))
+                            line_missed += int(elem.get("missed", 0))
+                    elif elem.tag == "package":
+                        pkg_name = elem.get("name", "default")
                         package_covered = 0
                         package_missed = 0
                         
                         # Sum up instruction counters for package
-                        for counter in package.findall("counter[@type='INSTRUCTION']"):
-                            covered = int(counter.get("covered", 0))
-                            missed = int(counter.get("missed", 0))
-                            package_covered += covered
-                            package_missed += missed
+                        for counter in elem.iterfind("counter[@type='INSTRUCTION']"):
+                            package_covered += int(counter.get("covered", 0))
+                            package_missed += int(counter.get("missed", 0))
                         
                         package_total = package_covered + package_missed
                         if package_total > 0:
-                            package_coverage = (package_covered / package_total) * 100
-                            coverage_data["by_package"][pkg_name] = round(package_coverage, 2)
-                    
-                    # Estimate critical path coverage
-                    critical_paths = [pkg for pkg in coverage_data["by_package"] 
-                                     if any(x in pkg.lower() for x in ['service', 'controller', 'api'])]
-                    if critical_paths:
-                        critical_coverage = sum(coverage_data["by_package"][pkg] for pkg in critical_paths) / len(critical_paths)
-                        coverage_data["critical_paths"] = round(critical_coverage, 2)
-                    else:
-                        coverage_data["critical_paths"] = coverage_data["overall"]
-                    
-                    self.metrics["code_coverage"] = coverage_data["overall"]
-                    self.metrics["critical_path_coverage"] = coverage_data["critical_paths"]
-                    
-                    print(f"Found coverage data: {coverage_data['overall']}% overall")
+                            package_coverage = round((package_covered / package_total) * 100, 2)
+                            coverage_data["by_package"][pkg_name] = package_coverage
+                        elem.clear()
+                
+                # Calculate overall coverage from the report's instruction counter
+                total_instructions = total_covered + total_missed
+                if total_instructions > 0:
+                    overall_coverage = (total_covered / total_instructions) * 100
+                    coverage_data["overall"] = round(overall_coverage, 2)
+                    print(f"Calculated actual coverage: {coverage_data['overall']}% ({total_covered} covered out of {total_instructions} instructions)")
+                
+                # If no overall coverage found, fall back to the LINE counter
+                if coverage_data["overall"] == 0:
+                    line_total = line_covered + line_missed
+                    if line_total > 0:
+                        coverage_data["overall"] = round(line_covered / line_total * 100, 2)
+                
+                # Estimate critical path coverage over the distinct packages; a
+                # package repeated across <group> elements counts once
+                critical_sum = 0
+                critical_count = 0
+                for pkg_name, package_coverage in coverage_data["by_package"].items():
+                    pkg_low = pkg_name.lower()
+                    if 'service' in pkg_low or 'controller' in pkg_low or 'api' in pkg_low:
+                        critical_sum += package_coverage
+                        critical_count += 1
+                if critical_count:
+                    coverage_data["critical_paths"] = round(critical_sum / critical_count, 2)
+                else:
+                    coverage_data["critical_paths"] = coverage_data["overall"]
+                
+                self.metrics["code_coverage"] = coverage_data["overall"]
+                self.metrics["critical_path_coverage"] = coverage_data["critical_paths"]
+                
+                print(f"Found coverage data: {coverage_data['overall']}% overall")
+                
+                # Don't just return 0% coverage - that triggers the estimation logic
+                if self.metrics["code_coverage"] < 1 and total_covered > 0:
+                    # If we have any coverage at all, report at least 1%
+                    self.metrics["code_coverage"] = 1.0
                     
-                    # Don't just return 0% coverage - that triggers the estimation logic
-                    if self.metrics["code_coverage"] < 1 and total_covered > 0:
-                        # If we have any coverage at all, report at least 1%
-                        self.metrics["code_coverage"] = 1.0
-                        
-                    return coverage_data
-                except Exception as e:
-                    print(f"Error parsing coverage report {path}: {str(e)}")
-        
+                return coverage_data
+            except Exception as e:
+                print(f"Error parsing coverage report {path}: {str(e)}")
+    
         # If we've reached here, we couldn't find or parse any coverage reports
         
         # Let's check if the exec file exists but we couldn't process it
-        if os.path.exists(jacoco_exec):
-            print(f"Found JaCoCo exec file at {jacoco_exec} but couldn't process it into usable coverage data.")
+        if exec_files:
+            print(f"Found JaCoCo exec file at {', '.join(exec_files)} but couldn't process it into usable coverage data.")
             print("You may need to install JaCoCo CLI tools to generate reports.")
             
             # Provide a fallback estimate based on test counts
@@ -202,14 +347,19 @@ class CorrectnessAnalyzer:
                 for file in os.listdir(report_dir):
                     if file.endswith(".xml") and (file.startswith("TEST-") or file.startswith("Arquillian")):
                         try:
-                            tree = ET.parse(os.path.join(report_dir, file))
-                            root = tree.getroot()
+                            # Only the root attributes are needed; stop before
+                            # the parser reaches any <system-out> CDATA
+                            handler = _SuiteCountsHandler()
+                            try:
+                                xml.sax.parse(os.path.join(report_dir, file), handler)
+                            except _SuiteHeaderRead:
+                                pass
                             
                             # Count test results
-                            tests = int(root.get("tests", 0))
-                            failures = int(root.get("failures", 0))
-                            errors = int(root.get("errors", 0))
-                            skipped = int(root.get("skipped", 0))
+                            tests = int(handler.counts.get("tests", 0))
+                            failures = int(handler.counts.get("failures", 0))
+                            errors = int(handler.counts.get("errors", 0))
+                            skipped = int(handler.counts.get("skipped", 0))
                             
                             test_results["total"] += tests
                             test_results["failed"] += failures + errors
@@ -220,35 +370,31 @@ class CorrectnessAnalyzer:
         
         # Add specific detection for Arquillian tests
         arquillian_detected = False
-        for test_file in self.test_files:
-            try:
-                with open(test_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    if 'org.jboss.arquillian' in content or '@RunWith(Arquillian.class)' in content:
-                        arquillian_detected = True
-                        test_types["arquillian"] += 1
-                        # Also categorize by type
-                        if any(x in content for x in ['Repository', 'EntityManager', 'jdbc', 'sql']):
-                            test_types["data_store"] += 1
-                        else:
-                            test_types["integration"] += 1
-                    else:
-                        # Process as before for non-Arquillian tests
-                        file_name = os.path.basename(test_file)
-                        if 'IT.java' in file_name or 'Integration' in file_name:
-                            test_types["integration"] += 1
-                        elif any(x in file_name for x in ['Repository', 'DAO', 'Data']):
-                            test_types["data_store"] += 1
-                        else:
-                            test_types["unit"] += 1
-                            
-                        # Check content for data store tests
-                        if test_types["data_store"] == 0 and re.search(r'Repository|EntityManager|DataSource|jdbc|sql', content):
-                            test_types["data_store"] += 1
-                            if test_types["unit"] > 0:  # Avoid negative values
-                                test_types["unit"] -= 1
-            except Exception as e:
-                print(f"Error analyzing test file {test_file}: {str(e)}")
+        # Files are scanned concurrently but tallied in order, since the
+        # data store fallback below depends on what came before
+        scans = _scan_test_files([test_file for test_file, _ in self.test_files])
+        for (test_file, category), (markers, error) in zip(self.test_files, scans):
+            if error is not None:
+                print(f"Error analyzing test file {test_file}: {str(error)}")
+                continue
+            self._framework_flags_by_file[test_file] = _framework_flags(markers)
+            if markers & _ARQUILLIAN_MARKERS:
+                arquillian_detected = True
+                test_types["arquillian"] += 1
+                # Also categorize by type
+                if markers & _ARQUILLIAN_DATA_STORE_MARKERS:
+                    test_types["data_store"] += 1
+                else:
+                    test_types["integration"] += 1
+            else:
+                # Non-Arquillian tests use the category find_files took from the name
+                test_types[category] += 1
+                
+                # Check content for data store tests
+                if test_types["data_store"] == 0 and markers & _DATA_STORE_MARKERS:
+                    test_types["data_store"] += 1
+                    if test_types["unit"] > 0:  # Avoid negative values
+                        test_types["unit"] -= 1
         
         # If Arquillian detected but no test results, we may need manual testing
         if arquillian_detected and test_results["total"] == 0:
@@ -345,16 +491,22 @@ class CorrectnessAnalyzer:
             except Exception:
                 pass
         
-        # Also check test files directly for imports
-        for test_file in self.test_files:
-            try:
-                with open(test_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    frameworks["junit"] |= "org.junit" in content
-                    frameworks["mockito"] |= "org.mockito" in content
-                    frameworks["arquillian"] |= "org.jboss.arquillian" in content
-            except Exception:
-                pass
+        # Also check test files directly for imports, reusing the flags
+        # analyze_tests recorded and only reading files it did not scan
+        used = 0
+        unscanned = []
+        for test_file, _ in self.test_files:
+            flags = self._framework_flags_by_file.get(test_file)
+            if flags is None:
+                unscanned.append(test_file)
+            else:
+                used |= flags
+        for markers, error in _scan_test_files(unscanned):
+            if error is None:
+                used |= _framework_flags(markers)
+        frameworks["junit"] |= bool(used & _USES_JUNIT)
+        frameworks["mockito"] |= bool(used & _USES_MOCKITO)
+        frameworks["arquillian"] |= bool(used & _USES_ARQUILLIAN)
         
         # Generate list of missing frameworks
         if not (frameworks["junit"] or frameworks["arquillian"]):
@@ -366,8 +518,17 @@ class CorrectnessAnalyzer:
         
         return frameworks
     
-    def analyze(self):
-        """Run the complete analysis"""
+    def analyze(self, force_refresh=False):
+        """Run the complete analysis; later calls reuse the result unless force_refresh"""
+        if self._analysis_cache is not None:
+            if not force_refresh:
+                return self._analysis_cache
+            self.java_files = []
+            self.test_files = []
+            self._scanned = False
+            self._framework_flags_by_file = {}
+            self.metrics = _initial_metrics()
+        
         print("Analyzing code correctness...")
         
         src_count, test_count = self.find_files()
@@ -380,7 +541,7 @@ class CorrectnessAnalyzer:
         
         # Generate report
         report = {
-            "metrics": self.metrics,
+            "metrics": dict(self.metrics),
             "coverage": coverage_data,
             "tests": test_results,
             "test_types": test_types,
@@ -388,13 +549,14 @@ class CorrectnessAnalyzer:
             "score": score_data
         }
         
+        self._analysis_cache = report
         return report
     
-    def generate_report(self):
-        """Generate a human-readable report"""
+    def report_parts(self):
+        """Build the human-readable report as a list of text fragments"""
         report = self.analyze()
         
-        output = f"""
+        parts = [f"""
 Correctness Analysis Report
 ==========================
 
@@ -402,46 +564,50 @@ Overall Score: {report['score']['score']}/100 (Grade: {report['score']['grade']}
 
 Test Metrics:
 ------------
-"""
+"""]
         if self.metrics.get("coverage_estimated", False):
-            output += f"Code Coverage: {self.metrics['code_coverage']}% (ESTIMATED - actual coverage data not available)\n"
-            output += f"Critical Path Coverage: {self.metrics['critical_path_coverage']}% (ESTIMATED)\n"
+            parts.append(f"Code Coverage: {self.metrics['code_coverage']}% (ESTIMATED - actual coverage data not available)\n")
+            parts.append(f"Critical Path Coverage: {self.metrics['critical_path_coverage']}% (ESTIMATED)\n")
         else:
-            output += f"Code Coverage: {self.metrics['code_coverage']}%\n"
-            output += f"Critical Path Coverage: {self.metrics['critical_path_coverage']}%\n"
+            parts.append(f"Code Coverage: {self.metrics['code_coverage']}%\n")
+            parts.append(f"Critical Path Coverage: {self.metrics['critical_path_coverage']}%\n")
         
-        output += f"""Total Tests: {self.metrics['total_tests']}
+        parts.append(f"""Total Tests: {self.metrics['total_tests']}
 Passing Tests: {self.metrics['passing_tests']} ({round(self.metrics['passing_tests']/max(1, self.metrics['total_tests'])*100)}%)
 Failing Tests: {self.metrics['failing_tests']}
 Data Store Test Coverage: {self.metrics['data_store_test_coverage']}%
 
 Test Framework Status:
 --------------------
-"""
+""")
         if report['frameworks']['missing']:
-            output += f"Missing frameworks: {', '.join(report['frameworks']['missing'])}\n"
-            output += "\nRecommendations:\n"
+            parts.append(f"Missing frameworks: {', '.join(report['frameworks']['missing'])}\n")
+            parts.append("\nRecommendations:\n")
             
             if "JUnit" in report['frameworks']['missing']:
-                output += "- Add JUnit to your project for unit testing\n"
+                parts.append("- Add JUnit to your project for unit testing\n")
             if "Mockito" in report['frameworks']['missing']:
-                output += "- Add Mockito for mocking dependencies in tests\n"
+                parts.append("- Add Mockito for mocking dependencies in tests\n")
             if "JaCoCo" in report['frameworks']['missing']:
-                output += "- Add JaCoCo for code coverage analysis\n"
+                parts.append("- Add JaCoCo for code coverage analysis\n")
         else:
-            output += "All key testing frameworks are present\n"
+            parts.append("All key testing frameworks are present\n")
             
         if self.metrics['code_coverage'] < 70:
-            output += "\nImprovement Areas:\n"
-            output += f"- Increase code coverage (currently {self.metrics['code_coverage']}%, aim for 70%+)\n"
+            parts.append("\nImprovement Areas:\n")
+            parts.append(f"- Increase code coverage (currently {self.metrics['code_coverage']}%, aim for 70%+)\n")
             
         if self.metrics['critical_path_coverage'] < 80:
-            output += f"- Focus on testing critical paths (currently {self.metrics['critical_path_coverage']}%, aim for 80%+)\n"
+            parts.append(f"- Focus on testing critical paths (currently {self.metrics['critical_path_coverage']}%, aim for 80%+)\n")
             
         if self.metrics['data_store_test_coverage'] < 50:
-            output += f"- Add more data store tests (currently {self.metrics['data_store_test_coverage']}%)\n"
+            parts.append(f"- Add more data store tests (currently {self.metrics['data_store_test_coverage']}%)\n")
             
-        return output
+        return parts
+    
+    def generate_report(self):
+        """Generate a human-readable report"""
+        return "".join(self.report_parts())
 
 def main():
     import argparse
@@ -463,12 +629,12 @@ def main():
         else:
             print(result)
     else:
-        report = analyzer.generate_report()
+        parts = analyzer.report_parts()
         if args.output:
             with open(args.output, 'w') as f:
-                f.write(report)
+                f.writelines(parts)
         else:
-            print(report)
+            print("".join(parts))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file